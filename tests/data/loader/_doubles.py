@@ -0,0 +1,24 @@
+"""Loader doubles for tests of code that depends on TimeSeriesLoader."""
+
+from typing import Any
+
+
+class StubTimeSeriesLoader:
+    """Time series loader double that returns fixed values and records calls."""
+
+    def __init__(self, *, intervals: list[float] | None = None, boundaries: list[float] | None = None) -> None:
+        """Initialize the stub with the values each load method returns."""
+        self.intervals = intervals or []
+        self.boundaries = boundaries or []
+        self.interval_calls: list[dict[str, Any]] = []
+        self.boundary_calls: list[dict[str, Any]] = []
+
+    async def load_intervals(self, **kwargs: Any) -> list[float]:
+        """Record the call and return the configured interval values."""
+        self.interval_calls.append(kwargs)
+        return list(self.intervals)
+
+    async def load_boundaries(self, **kwargs: Any) -> list[float]:
+        """Record the call and return the configured boundary values."""
+        self.boundary_calls.append(kwargs)
+        return list(self.boundaries)
@@ -1,43 +1,33 @@
 """Tests for data extractor functionality."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import State
 import pytest
 
 from custom_components.haeo.data.loader import extractors
-from tests.test_data.sensors import ALL_INVALID_SENSORS, ALL_VALID_SENSORS
+from tests.test_data.sensors import ALL_INVALID_SENSORS, ALL_VALID_SENSORS, INVALID_SENSORS_BY_PARSER
 
 
-def _create_sensor_state(hass: HomeAssistant, entity_id: str, state_value: str, attributes: dict[str, Any]) -> State:
-    """Create a sensor state and return it.
+def _sensor_id(val: Any) -> str:
+    """Return a readable test id for a sensor test case."""
+    return val.get("description", str(val)) if isinstance(val, dict) else str(val)
 
-    Args:
-        hass: Home Assistant instance
-        entity_id: Entity ID to create
-        state_value: State value to set
-        attributes: State attributes to set
 
-    Returns:
-        The created state object
-
-    """
-    hass.states.async_set(entity_id, state_value, attributes)
-
-    if (state := hass.states.get(entity_id)) is None:
-        msg = f"Failed to get state for {entity_id}"
-        raise RuntimeError(msg)
-    return state
+_VALID_IDS = [_sensor_id(sensor) for _, sensor in ALL_VALID_SENSORS]
+_INVALID_IDS = [_sensor_id(sensor) for _, sensor in ALL_INVALID_SENSORS]
 
 
 @pytest.mark.parametrize(
     ("parser_type", "sensor_data"),
     ALL_VALID_SENSORS,
-    ids=lambda val: val.get("description", str(val)) if isinstance(val, dict) else str(val),
+    ids=_VALID_IDS,
 )
-def test_extract_valid_sensors(hass: HomeAssistant, parser_type: str, sensor_data: dict[str, Any]) -> None:
+def test_extract_valid_sensors(parser_type: str, sensor_data: dict[str, Any]) -> None:
     """Test extraction of valid forecast data."""
-    state = _create_sensor_state(hass, sensor_data["entity_id"], sensor_data["state"], sensor_data["attributes"])
+    state = State(sensor_data["entity_id"], sensor_data["state"], sensor_data["attributes"])
 
     result = extractors.extract(state)
 
@@ -56,12 +46,12 @@ def test_extract_valid_sensors(hass: HomeAssistant, parser_type: str, sensor_dat
 @pytest.mark.parametrize(
     ("parser_type", "sensor_data"),
     ALL_INVALID_SENSORS,
-    ids=lambda val: val.get("description", str(val)) if isinstance(val, dict) else str(val),
+    ids=_INVALID_IDS,
 )
-def test_invalid_sensor_handling(hass: HomeAssistant, parser_type: str, sensor_data: dict[str, Any]) -> None:
+def test_invalid_sensor_handling(parser_type: str, sensor_data: dict[str, Any]) -> None:
     """Test handling of invalid sensor data."""
     entity_id = sensor_data["entity_id"]
-    state = _create_sensor_state(hass, entity_id, sensor_data["state"], sensor_data["attributes"])
+    state = State(entity_id, sensor_data["state"], sensor_data["attributes"])
 
     # Invalid sensors should fall back to simple value extraction
     result = extractors.extract(state)
@@ -70,9 +60,9 @@ def test_invalid_sensor_handling(hass: HomeAssistant, parser_type: str, sensor_d
     assert isinstance(result.data, float)
 
 
-def test_extract_empty_data(hass: HomeAssistant) -> None:
+def test_extract_empty_data() -> None:
     """Test extraction with empty attributes falls back to simple value."""
-    state = _create_sensor_state(hass, "sensor.empty", "42.0", {})
+    state = State("sensor.empty", "42.0", {})
 
     result = extractors.extract(state)
 
@@ -80,10 +70,10 @@ def test_extract_empty_data(hass: HomeAssistant) -> None:
     assert result.data == 42.0
 
 
-def test_extract_unknown_format_falls_back_to_simple_value(hass: HomeAssistant) -> None:
+def test_extract_unknown_format_falls_back_to_simple_value() -> None:
     """Test that extracting from unknown format falls back to simple value."""
     entity_id = "sensor.unknown"
-    state = _create_sensor_state(hass, entity_id, "42.5", {"unknown_field": "value"})
+    state = State(entity_id, "42.5", {"unknown_field": "value"})
 
     result = extractors.extract(state)
 
@@ -109,12 +99,11 @@ def test_extract_unknown_format_returns_unit() -> None:
     assert result == extractors.ExtractedData(42.0, "test_unit")
 
 
-def test_extract_raises_for_non_numeric_state(hass: HomeAssistant) -> None:
+def test_extract_raises_for_non_numeric_state() -> None:
     """Simple value extraction should raise when the sensor state is not numeric."""
 
     entity_id = "sensor.invalid_numeric"
-    state = _create_sensor_state(
-        hass,
+    state = State(
         entity_id,
         "not-a-number",
         {"unit_of_measurement": "kWh"},
@@ -124,15 +113,29 @@ def test_extract_raises_for_non_numeric_state(hass: HomeAssistant) -> None:
         extractors.extract(state)
 
 
-PARSER_MAP: dict[str, extractors.DataExtractor] = {
-    extractors.amber2mqtt.DOMAIN: extractors.amber2mqtt.Parser,
-    extractors.amberelectric.DOMAIN: extractors.amberelectric.Parser,
-    extractors.aemo_nem.DOMAIN: extractors.aemo_nem.Parser,
-    extractors.flow_power.DOMAIN: extractors.flow_power.Parser,
-    extractors.haeo.DOMAIN: extractors.haeo.Parser,
-    extractors.solcast_solar.DOMAIN: extractors.solcast_solar.Parser,
-    extractors.open_meteo_solar_forecast.DOMAIN: extractors.open_meteo_solar_forecast.Parser,
-}
+_PARSER_MAP: Mapping[extractors.ExtractorFormat, extractors.DataExtractor] = MappingProxyType(extractors.FORMATS)
+_PARSER_TYPES: tuple[extractors.ExtractorFormat, ...] = tuple(sorted(_PARSER_MAP))
+
+_INVALID_CASES: list[tuple[extractors.ExtractorFormat, dict[str, Any]]] = [
+    (parser_type, sensor) for parser_type in _PARSER_TYPES for sensor in INVALID_SENSORS_BY_PARSER.get(parser_type, [])
+]
+_INVALID_CASE_IDS = [f"{parser_type}-{sensor['description']}" for parser_type, sensor in _INVALID_CASES]
+
+
+def test_parser_registry_matches_invalid_sensor_data() -> None:
+    """Every registered parser should have invalid test data, and vice versa."""
+    assert set(_PARSER_MAP) == set(INVALID_SENSORS_BY_PARSER)
+
+
+@pytest.mark.parametrize(("parser_type", "sensor"), _INVALID_CASES, ids=_INVALID_CASE_IDS)
+def test_parser_detect_rejects_invalid_payloads(
+    parser_type: extractors.ExtractorFormat, sensor: dict[str, Any]
+) -> None:
+    """Each parser should reject its own invalid payloads, one test case per sensor."""
+    parser_cls = _PARSER_MAP[parser_type]
+    state = State(sensor["entity_id"], sensor["state"], sensor["attributes"])
+
+    assert parser_cls.detect(state) is False, sensor["description"]
 
 
 # --- Interpolation Mode Tests ---
@@ -141,10 +144,9 @@ PARSER_MAP: dict[str, extractors.DataExtractor] = {
 class TestInterpolationModeExtraction:
     """Tests for interpolation_mode attribute extraction."""
 
-    def test_no_interpolation_mode_uses_linear(self, hass: HomeAssistant) -> None:
+    def test_no_interpolation_mode_uses_linear(self) -> None:
         """When no interpolation_mode attribute, data is unchanged (linear)."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -161,10 +163,9 @@ class TestInterpolationModeExtraction:
         # Linear mode: only the original 2 points
         assert len(result.data) == 2
 
-    def test_linear_mode_explicit(self, hass: HomeAssistant) -> None:
+    def test_linear_mode_explicit(self) -> None:
         """Explicit linear mode leaves data unchanged."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -181,10 +182,9 @@ class TestInterpolationModeExtraction:
         assert isinstance(result.data, list)
         assert len(result.data) == 2
 
-    def test_previous_mode_adds_synthetic_points(self, hass: HomeAssistant) -> None:
+    def test_previous_mode_adds_synthetic_points(self) -> None:
         """Previous mode adds synthetic points for step function behavior."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -208,10 +208,9 @@ class TestInterpolationModeExtraction:
         # Second point
         assert result.data[2][1] == 200.0
 
-    def test_next_mode_adds_synthetic_points(self, hass: HomeAssistant) -> None:
+    def test_next_mode_adds_synthetic_points(self) -> None:
         """Next mode adds synthetic points for forward step behavior."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -235,10 +234,9 @@ class TestInterpolationModeExtraction:
         # Second point
         assert result.data[2][1] == 200.0
 
-    def test_nearest_mode_adds_synthetic_points(self, hass: HomeAssistant) -> None:
+    def test_nearest_mode_adds_synthetic_points(self) -> None:
         """Nearest mode adds synthetic points at midpoints."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -256,10 +254,9 @@ class TestInterpolationModeExtraction:
         # Nearest mode: 2 original + 2 synthetic = 4 points
         assert len(result.data) == 4
 
-    def test_invalid_mode_falls_back_to_linear(self, hass: HomeAssistant) -> None:
+    def test_invalid_mode_falls_back_to_linear(self) -> None:
         """Invalid interpolation_mode value falls back to linear."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.haeo_forecast",
             "100.0",
             {
@@ -277,10 +274,9 @@ class TestInterpolationModeExtraction:
         # Falls back to linear: only 2 points
         assert len(result.data) == 2
 
-    def test_simple_value_ignores_interpolation_mode(self, hass: HomeAssistant) -> None:
+    def test_simple_value_ignores_interpolation_mode(self) -> None:
         """Interpolation mode is ignored for simple (non-forecast) values."""
-        state = _create_sensor_state(
-            hass,
+        state = State(
             "sensor.simple",
             "42.0",
             {
@@ -14,8 +14,9 @@ Lower-level logic is tested in:
 - tests/data/util/test_forecast_combiner.py (combining logic)
 """
 
+from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.core import HomeAssistant, State
@@ -25,6 +26,13 @@ from custom_components.haeo.data.loader.extractors import ExtractedData
 from custom_components.haeo.data.loader.time_series_loader import TimeSeriesLoader
 
 
+@pytest.fixture
+def patched_extract() -> Generator[MagicMock]:
+    """Patch sensor extraction so tests can supply their own extracted data."""
+    with patch("custom_components.haeo.data.loader.sensor_loader.extract") as mock_extract:
+        yield mock_extract
+
+
 async def test_time_series_loader_available_handles_missing_sensor(hass: HomeAssistant) -> None:
     """Loader is unavailable when any referenced sensor is missing."""
 
@@ -91,7 +99,9 @@ async def test_time_series_loader_requires_sensor_entities(hass: HomeAssistant)
         await loader.load_intervals(hass=hass, value=[], forecast_times=[1])
 
 
-async def test_time_series_loader_loads_mixed_live_and_forecast(hass: HomeAssistant) -> None:
+async def test_time_series_loader_loads_mixed_live_and_forecast(
+    hass: HomeAssistant, patched_extract: MagicMock
+) -> None:
     """Loader combines live values with forecast series and aligns to the horizon."""
 
     loader = TimeSeriesLoader()
@@ -117,15 +127,15 @@ async def test_time_series_loader_loads_mixed_live_and_forecast(hass: HomeAssist
 
     hass.states.async_set("sensor.live_price", "0.20", {})
     hass.states.async_set("sensor.forecast_price", "0.25", {})
+    patched_extract.side_effect = mock_extract
 
-    with patch("custom_components.haeo.data.loader.sensor_loader.extract", side_effect=mock_extract):
-        assert loader.available(hass=hass, value=["sensor.live_price", "sensor.forecast_price"]) is True
+    assert loader.available(hass=hass, value=["sensor.live_price", "sensor.forecast_price"]) is True
 
-        result = await loader.load_intervals(
-            hass=hass,
-            value=["sensor.live_price", "sensor.forecast_price"],
-            forecast_times=ts_values,
-        )
+    result = await loader.load_intervals(
+        hass=hass,
+        value=["sensor.live_price", "sensor.forecast_price"],
+        forecast_times=ts_values,
+    )
 
     # Returns n_periods interval values (len(ts_values)-1)
     assert len(result) == len(ts_values) - 1
@@ -152,7 +162,7 @@ async def test_time_series_loader_returns_empty_series_for_empty_horizon(hass: H
 # --- Tests for load_boundaries() ---
 
 
-async def test_load_boundaries_returns_n_plus_1_values(hass: HomeAssistant) -> None:
+async def test_load_boundaries_returns_n_plus_1_values(hass: HomeAssistant, patched_extract: MagicMock) -> None:
     """load_boundaries returns n+1 values for n+1 boundary timestamps."""
     loader = TimeSeriesLoader()
 
@@ -172,13 +182,13 @@ async def test_load_boundaries_returns_n_plus_1_values(hass: HomeAssistant) -> N
         )
 
     hass.states.async_set("sensor.capacity", "10.0", {})
+    patched_extract.side_effect = mock_extract
 
-    with patch("custom_components.haeo.data.loader.sensor_loader.extract", side_effect=mock_extract):
-        result = await loader.load_boundaries(
-            hass=hass,
-            value=["sensor.capacity"],
-            forecast_times=ts_values,
-        )
+    result = await loader.load_boundaries(
+        hass=hass,
+        value=["sensor.capacity"],
+        forecast_times=ts_values,
+    )
 
     # Returns n+1 values (one per boundary)
     assert len(result) == len(ts_values)
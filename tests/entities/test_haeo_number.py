@@ -3,7 +3,7 @@
 import asyncio
 from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import Mock
 
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.config_entries import ConfigSubentry
@@ -24,6 +24,7 @@ from custom_components.haeo.entities.haeo_number import (
 )
 from custom_components.haeo.horizon import HorizonManager
 from custom_components.haeo.model import OutputType
+from tests.data.loader._doubles import StubTimeSeriesLoader
 
 # --- Fixtures ---
 
@@ -836,7 +837,7 @@ async def test_horizon_change_updates_forecast_timestamps_driven(
     )
 
     # Load initial data
-    entity._loader.load_intervals = AsyncMock(return_value=[1.0, 2.0])
+    entity._loader = StubTimeSeriesLoader(intervals=[1.0, 2.0])  # type: ignore[assignment]
     await entity._async_load_data()
     assert entity.horizon_start == 0.0
 
@@ -853,7 +854,7 @@ async def test_horizon_change_updates_forecast_timestamps_driven(
 
     # Change horizon and trigger update
     horizon_manager.get_forecast_timestamps.return_value = (100.0, 400.0, 700.0)
-    entity._loader.load_intervals = AsyncMock(return_value=[3.0, 4.0])
+    entity._loader = StubTimeSeriesLoader(intervals=[3.0, 4.0])  # type: ignore[assignment]
     entity._handle_horizon_change()
     await hass.async_block_till_done()
 
@@ -1010,16 +1011,17 @@ async def test_async_load_data_with_boundaries_field(
         horizon_manager=horizon_manager,
     )
 
-    # Mock loader to return boundary values (n+1 values)
-    # Use AsyncMock to properly mock the async method
-    entity._loader.load_boundaries = AsyncMock(return_value=[10.0, 20.0, 30.0])
-    entity._loader.load_intervals = AsyncMock()
+    # Stub loader to return boundary values (n+1 values)
+    loader = StubTimeSeriesLoader(boundaries=[10.0, 20.0, 30.0])
+    entity._loader = loader  # type: ignore[assignment]
 
     await entity._async_load_data()
 
     # Should call load_boundaries, not load_intervals
-    entity._loader.load_boundaries.assert_called_once()
-    entity._loader.load_intervals.assert_not_called()
+    assert len(loader.boundary_calls) == 1
+    assert loader.interval_calls == []
+    assert loader.boundary_calls[0]["value"] == ["sensor.soc"]
+    assert loader.boundary_calls[0]["forecast_times"] == [0.0, 300.0, 600.0]
 
     # Should have 3 values
     assert entity.native_value == 10.0
@@ -1084,8 +1086,8 @@ async def test_async_load_data_with_empty_values_list(
         horizon_manager=horizon_manager,
     )
 
-    # Mock loader to return empty list (not an exception, just empty result)
-    entity._loader.load_intervals = AsyncMock(return_value=[])
+    # Stub loader to return empty list (not an exception, just empty result)
+    entity._loader = StubTimeSeriesLoader(intervals=[])  # type: ignore[assignment]
 
     initial_value = entity.native_value
     await entity._async_load_data()